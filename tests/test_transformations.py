@@ -40,6 +40,31 @@ def test_all_transformations():
     github_text = f"{GITHUB_PAGE_LINK}\n{GITHUB_HEADER_LINK}\n{GITHUB_IMAGE_LINK}"
     assert run_all_transformations(obsidian_text) == github_text
 
+def test_all_transformations_same_line():
+    """Tests several links of different kinds on a single line."""
+    obsidian_text = "![[a.png]] ![[b.png]] [[Page Name|text]] [[#Some Header|here]]"
+    github_text = " [[a.png]]  [[b.png]] [[text|Page-Name]] [here](#some-header)"
+    assert run_all_transformations(obsidian_text) == github_text
+
+def test_all_transformations_independent_links():
+    """Tests that links which do not interact convert the same as running each transformation in turn."""
+    obsidian_text = f"{OBSIDIAN_IMAGE_LINK} {OBSIDIAN_PAGE_LINK}\n{OBSIDIAN_HEADER_LINK} {OBSIDIAN_IMAGE_LINK}"
+    expected = transform_image_links(transform_header_links(transform_page_links(obsidian_text)))
+    assert run_all_transformations(obsidian_text) == expected
+
+def test_all_transformations_converts_each_link_once():
+    """Tests that a converted link is not picked up again by another conversion."""
+    # page link whose text looks like a header: not turned into a header link afterwards
+    assert run_all_transformations("[[P|#h]]") == "[[#h|P]]"
+    # image embed of a header: only the '!' is dropped
+    assert run_all_transformations("![[#Sec|x]]") == " [[#Sec|x]]"
+
+def test_image_link_single_line():
+    """Tests that an image link is not matched across a line break."""
+    for text in ("![[ \n ]]", "a![[\n]]!b.png"):
+        assert transform_image_links(text) == text
+        assert run_all_transformations(text) == text
+
 # --- Edge Case Tests ---
 
 def test_no_links():
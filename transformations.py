@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import re
+from functools import lru_cache
 
 # PAGE LINK CONVERSION
 # [[file name|link text]] --> [[link text|file-name]]
@@ -10,33 +11,75 @@ def switch_fn_linktext(m):
     sub = f"{m.group(1)}{linktext}|{pagename}{m.group(4)}"
     return sub
 
+# This regex now specifically looks for links that are NOT image links (![[...]])
+# and not header links ([[#...]]) by checking the first characters.
+_PAGE_LINK_RE = re.compile(r"(?<!!)(\[\[)([^#\[\]][^\[\]]*?)\|([^\[\]|]+?)(\]\])")
+
 def transform_page_links(text):
-    # This regex now specifically looks for links that are NOT image links (![[...]])
-    # and not header links ([[#...]]) by checking the first characters.
-    return re.sub(r"(?<!!)(\[\[)([^#\[\]][^\[\]]*?)\|([^\[\]|]+?)(\]\])", switch_fn_linktext, text)
+    return _PAGE_LINK_RE.sub(switch_fn_linktext, text)
 
 # HEADER LINK CONVERSION
 # [[#Some header in the page|some text]] --> [some text](#some-header-in-the-page)
+# Wiki pages link to the same sections over and over, so the anchors are cached
+@lru_cache(maxsize=1024)
+def _header_anchor(header):
+    return header.replace(" ", "-").lower()
+
 def links_to_header(m):
     linktext = m.group(2)
-    pagename = m.group(1).replace(" ", "-").lower()
+    pagename = _header_anchor(m.group(1))
     sub = f"[{linktext}]({pagename})"
     return sub
 
+_HEADER_LINK_RE = re.compile(r"\[\[(#[^#|\[\]]+?)\|([^\[\]|]+?)\]\]")
+
 def transform_header_links(text):
-    return re.sub(r"\[\[(#[^#|\[\]]+?)\|([^\[\]|]+?)\]\]", links_to_header, text)
+    return _HEADER_LINK_RE.sub(links_to_header, text)
 
 # IMAGE LINK CONVERSION
 # ![[some image.png]] --> [[some image.png]]
 def remove_exclamation_mark(m):
-    sub = " " + m.group(2)
+    # Groups: 1: '[[image]]'
+    sub = " " + m.group(1)
     return sub
 
+# The link body stops at the first ']]' so that several images (or an image followed
+# by other links) on the same line are each matched on their own; like before, an
+# image link never spans lines.
+_IMAGE_LINK_RE = re.compile(r"!(\[\[[^\[\]\n]+\]\])")
+
 def transform_image_links(text):
-    return re.sub(r"(!)(\[\[.+\]\])", remove_exclamation_mark, text)
+    return _IMAGE_LINK_RE.sub(remove_exclamation_mark, text)
+
+# COMBINED CONVERSION
+# All three link regexes as named alternatives of one pattern, so the text is scanned once.
+# Each link is converted exactly once: unlike running the passes in sequence, the output of
+# one conversion is never matched again by another (e.g. [[P|#h]] --> [[#h|P]], not [P](#h)).
+_COMBINED_PARTS = {
+    "page": (_PAGE_LINK_RE, switch_fn_linktext),
+    "header": (_HEADER_LINK_RE, links_to_header),
+    "image": (_IMAGE_LINK_RE, remove_exclamation_mark),
+}
+_COMBINED_RE = re.compile("|".join(f"(?P<{name}>{regex.pattern})" for name, (regex, _) in _COMBINED_PARTS.items()))
+
+class _SubMatch:
+    # Numbers the groups of one alternative of _COMBINED_RE like its standalone regex,
+    # so the callbacks above can be reused unchanged.
+    def __init__(self, m, offset):
+        self._m = m
+        self._offset = offset
+
+    def group(self, index):
+        return self._m.group(self._offset + index)
+
+def _dispatch(m):
+    name = m.lastgroup
+    callback = _COMBINED_PARTS[name][1]
+    return callback(_SubMatch(m, _COMBINED_RE.groupindex[name]))
 
 def run_all_transformations(text):
-    text = transform_page_links(text)
-    text = transform_header_links(text)
-    text = transform_image_links(text)
-    return text
+    # Every link kind starts with '[[', so a plain substring test rejects
+    # files without links much faster than a regex scan
+    if "[[" not in text:
+        return text
+    return _COMBINED_RE.sub(_dispatch, text)